@@ -1,15 +1,29 @@
 import os
 import time
-import json
+import asyncio
+import math
 import logging
+import sqlite3
+import statistics
+import threading
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, List, Tuple, Type
 
+import orjson
 import requests
-from web3 import Web3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import AsyncWeb3, Web3
+from web3.providers import WebsocketProviderV2
 from web3.contract import Contract
 from web3.logs import DISCARD
-from web3.exceptions import ContractLogicError, TransactionNotFound
+from web3.utils.caching import SimpleCache
+from web3._utils.abi import get_abi_input_types
+from web3._utils.events import get_event_data
+from web3._utils.method_formatters import log_entry_formatter
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector, to_checksum_address
+from web3.exceptions import ContractLogicError, MethodUnavailable, TransactionNotFound
 from dotenv import load_dotenv
 
 # --- Basic Configuration ---
@@ -19,10 +33,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger('BridgeEventListener')
 
+# --- ABI Loading ---
+# Parsed ABIs, keyed by the JSON string itself or by the absolute path of an ABI file.
+# Values are (file mtime or None, parsed ABI).
+_ABI_CACHE: Dict[str, Tuple[Optional[float], List[Dict[str, Any]]]] = {}
+
+def load_abi(source: str) -> List[Dict[str, Any]]:
+    """
+    Parses a contract ABI, given either as a JSON string or as the path of a JSON file.
+    Each ABI is parsed once per process; files are only re-read when their mtime changes.
+    Repeated calls return the same list object, which keeps `ChainConnector`'s contract
+    caches effective.
+
+    Args:
+        source (str): The ABI as a JSON string, or the path of an ABI JSON file.
+
+    Returns:
+        List[Dict[str, Any]]: The parsed ABI.
+    """
+    if source.lstrip().startswith('['):
+        key, mtime = source, None
+    else:
+        key = os.path.abspath(source)
+        mtime = os.path.getmtime(key)
+
+    cached = _ABI_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    if mtime is None:
+        abi = orjson.loads(source)
+    else:
+        with open(key, 'rb') as abi_file:
+            abi = orjson.loads(abi_file.read())
+    _ABI_CACHE[key] = (mtime, abi)
+    return abi
+
 # --- Constants ---
-# In a real-world scenario, ABIs would be loaded from JSON files.
+# In a real-world scenario, ABIs would be loaded from JSON files with `load_abi`.
 # For this simulation, we define a simplified ABI for the source bridge contract.
-SOURCE_BRIDGE_ABI = json.loads('''
+SOURCE_BRIDGE_ABI = load_abi('''
 [
     {
         "anonymous": false,
@@ -40,7 +90,7 @@ SOURCE_BRIDGE_ABI = json.loads('''
 ''')
 
 # Simplified ABI for the destination bridge contract for simulation purposes.
-DESTINATION_BRIDGE_ABI = json.loads('''
+DESTINATION_BRIDGE_ABI = load_abi('''
 [
     {
         "inputs": [
@@ -57,6 +107,47 @@ DESTINATION_BRIDGE_ABI = json.loads('''
 ]
 ''')
 
+# The local nonce counter is re-read from the chain after this many reservations, so that
+# transactions sent by other tools from the same wallet are eventually accounted for.
+NONCE_RESYNC_INTERVAL = 100
+
+# Fragments of the errors nodes return when an eth_getLogs range is too large to serve.
+BLOCK_RANGE_ERROR_HINTS = (
+    'query returned more than',
+    'block range',
+    'range is too large',
+    'response size exceeded',
+    'timeout',
+    'timed out',
+)
+# Fragments of provider rate-limit errors. Shrinking the range would only multiply the
+# requests sent to a node that is already throttling, so these are never range errors.
+RATE_LIMIT_ERROR_HINTS = (
+    'rate limit',
+    'request limit',
+    'too many requests',
+    'request count exceeded',
+)
+# JSON-RPC error code used by several providers for "too many results", and by some also
+# for rate limiting (told apart by RATE_LIMIT_ERROR_HINTS).
+BLOCK_RANGE_ERROR_CODE = -32005
+# Number of consecutive successful chunks after a shrink before the chunk size is doubled again.
+BLOCK_RANGE_GROWTH_STREAK = 5
+# Destination fee parameters are reused for this many seconds before they are fetched again.
+FEE_TTL_SECONDS = 3
+# eth_feeHistory window (in blocks) and the priority fee percentile sampled from it.
+FEE_HISTORY_BLOCKS = 5
+FEE_REWARD_PERCENTILE = 50
+# Maximum number of RPC responses kept by each connector's response cache.
+RPC_CACHE_SIZE = 1024
+# Contract code queried at a block number or moving tag ('latest', ...) is only reused for this long.
+RPC_CODE_TAG_TTL_SECONDS = 60
+# Pooled keep-alive connections per RPC host, and the timeout for a single HTTP RPC request.
+HTTP_POOL_SIZE = 32
+RPC_REQUEST_TIMEOUT_SECONDS = 10
+# Expired entries are purged from the processed-transaction store once per this many inserts.
+PROCESSED_PRUNE_INTERVAL = 1000
+
 @dataclass
 class BridgeConfig:
     """Dataclass to hold configuration for the bridge listener."""
@@ -67,6 +158,151 @@ class BridgeConfig:
     listener_private_key: str # For signing transactions on the destination chain
     start_block: int = 0
     poll_interval_seconds: int = 15
+    max_block_range: int = 2048 # Upper bound on the blocks covered by a single eth_getLogs call
+    processed_db_path: str = 'processed_transactions.db'
+    processed_retention_days: int = 30 # How long processed transaction IDs are remembered
+    cursor_file: str = '.bridge_cursor' # Persists the last processed block across restarts
+    max_concurrent_releases: int = 16 # Release transactions built, signed and sent in parallel
+
+def is_block_range_error(error: Exception) -> bool:
+    """
+    Checks whether an RPC error means the requested log range was too large to serve.
+
+    Args:
+        error (Exception): The exception raised by the RPC call.
+
+    Returns:
+        bool: True if retrying with a smaller block range may succeed.
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    details = error.args[0] if error.args else None
+    code = None
+    if isinstance(details, dict):
+        code = details.get('code')
+        message = str(details.get('message', ''))
+    else:
+        message = str(error)
+    message = message.lower()
+    if any(hint in message for hint in RATE_LIMIT_ERROR_HINTS):
+        return False
+    return code == BLOCK_RANGE_ERROR_CODE or any(hint in message for hint in BLOCK_RANGE_ERROR_HINTS)
+
+def rpc_cache_ttl(method: str, params: Any, response: Dict[str, Any]) -> Optional[float]:
+    """
+    Decides how long an RPC response may be served from cache.
+    Only answers that cannot change are kept forever: the chain ID, blocks by hash, and
+    contract code at a block given by hash (EIP-1898). Code at a block number or a moving
+    tag such as 'latest' is kept briefly, since a reorg can replace that block. Receipts
+    are not cached: a receipt from a recent block can be reorged out of the chain.
+
+    Args:
+        method (str): The JSON-RPC method.
+        params (Any): The request parameters.
+        response (Dict[str, Any]): The node's response.
+
+    Returns:
+        Optional[float]: Seconds to cache the response for, or None to not cache it.
+    """
+    if 'error' in response or response.get('result') is None:
+        return None
+    if method in ('eth_chainId', 'eth_getBlockByHash'):
+        return math.inf
+    if method == 'eth_getCode':
+        block = params[1] if len(params) > 1 else 'latest'
+        if isinstance(block, dict) and 'blockHash' in block:
+            return math.inf
+        return RPC_CODE_TAG_TTL_SECONDS
+    return None
+
+def _rpc_cache_key(method: str, params: Any) -> str:
+    return f"{method}:{params!r}"
+
+def _get_cached_response(cache: SimpleCache, key: str) -> Optional[Dict[str, Any]]:
+    entry = cache.get_cache_entry(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if time.monotonic() >= expires_at:
+        cache.pop(key)
+        return None
+    return response
+
+def _cache_response(cache: SimpleCache, key: str, method: str, params: Any, response: Dict[str, Any]):
+    ttl = rpc_cache_ttl(method, params, response)
+    if ttl is not None:
+        cache.cache(key, (time.monotonic() + ttl, response))
+
+def construct_rpc_cache_middleware(cache: SimpleCache) -> Callable:
+    """
+    Builds a web3 middleware that serves immutable RPC responses from `cache`
+    (see `rpc_cache_ttl` for what is cached and for how long).
+
+    Args:
+        cache (SimpleCache): The bounded cache to store responses in.
+
+    Returns:
+        Callable: The middleware, to be added to a Web3 instance's middleware onion.
+    """
+    def rpc_cache_middleware(make_request, w3):
+        def middleware(method, params):
+            key = _rpc_cache_key(method, params)
+            response = _get_cached_response(cache, key)
+            if response is None:
+                response = make_request(method, params)
+                _cache_response(cache, key, method, params, response)
+            return response
+        return middleware
+    return rpc_cache_middleware
+
+def construct_async_rpc_cache_middleware(cache: SimpleCache) -> Callable:
+    """
+    Async counterpart of `construct_rpc_cache_middleware`, for AsyncWeb3 instances.
+
+    Args:
+        cache (SimpleCache): The bounded cache to store responses in.
+
+    Returns:
+        Callable: The async middleware.
+    """
+    async def async_rpc_cache_middleware(make_request, async_w3):
+        async def middleware(method, params):
+            key = _rpc_cache_key(method, params)
+            response = _get_cached_response(cache, key)
+            if response is None:
+                response = await make_request(method, params)
+                _cache_response(cache, key, method, params, response)
+            return response
+        return middleware
+    return async_rpc_cache_middleware
+
+def build_http_session() -> requests.Session:
+    """
+    Creates the requests session used for HTTP RPC endpoints: a larger keep-alive connection
+    pool, so bursts of requests reuse open TCP/TLS connections instead of reconnecting, and
+    automatic retries with backoff on transient gateway errors.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retries = Retry(
+        total=5,
+        backoff_factor=0.3,
+        # Read timeouts are re-raised as-is (`read=0` would still wrap them): once retries are
+        # involved requests reports them as a ConnectionError, hiding the Timeout that makes the
+        # scanner shrink a slow eth_getLogs range (see `_scan_in_chunks`), and every retry would
+        # resend the heaviest query we make.
+        read=False,
+        status_forcelist=[502, 503, 504],
+        # JSON-RPC is POST-only; urllib3 does not retry POST unless told to.
+        allowed_methods=frozenset(['POST']),
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
 
 class ChainConnector:
     """Handles connection and contract interaction with a specific blockchain."""
@@ -79,15 +315,39 @@ class ChainConnector:
             rpc_url (str): The HTTP or WebSocket RPC endpoint for the blockchain node.
         """
         self.rpc_url = rpc_url
-        self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        self.is_websocket = rpc_url.startswith(('ws://', 'wss://'))
+        if self.is_websocket:
+            self._session = None
+            self.web3 = Web3(Web3.WebsocketProvider(self.rpc_url))
+        else:
+            # Shared with the provider so batched calls reuse the same connection pool.
+            self._session = build_http_session()
+            self.web3 = Web3(Web3.HTTPProvider(
+                self.rpc_url,
+                request_kwargs={'timeout': RPC_REQUEST_TIMEOUT_SECONDS},
+                session=self._session
+            ))
+        # Responses that a reorg cannot change (chain ID, blocks by hash, code by block hash) are
+        # cached for good, and contract code at a block number or tag for RPC_CODE_TAG_TTL_SECONDS;
+        # see `rpc_cache_ttl`. The cache is shared by the sync and async Web3 instances of this endpoint.
+        self._rpc_cache = SimpleCache(RPC_CACHE_SIZE)
+        self.web3.middleware_onion.add(construct_rpc_cache_middleware(self._rpc_cache), 'rpc_cache')
         if not self.web3.is_connected():
-            logger.error(f"Failed to connect to blockchain node at {rpc_url}")
+            logger.error("Failed to connect to blockchain node at %s", rpc_url)
             raise ConnectionError(f"Unable to connect to {rpc_url}")
-        logger.info(f"Successfully connected to chain with ID: {self.web3.eth.chain_id}")
+        self.chain_id = self.web3.eth.chain_id
+        logger.info("Successfully connected to chain with ID: %s", self.chain_id)
+        self._async_web3: Optional[AsyncWeb3] = None
+        # Contract factories are bound to this connector's Web3 instance, so both caches
+        # live here. ABIs are module-level constants, so id(abi) is stable for the process.
+        self._factory_cache: Dict[int, Type[Contract]] = {}
+        self._contract_cache: Dict[Tuple[str, int], Contract] = {}
 
     def get_contract(self, address: str, abi: Dict[str, Any]) -> Contract:
         """
         Loads and returns a Web3 contract instance.
+        The contract factory (ABI normalization, function/event class generation) is built
+        once per ABI, and bound contracts are cached per address, so repeated calls are cheap.
 
         Args:
             address (str): The contract's address.
@@ -97,7 +357,134 @@ class ChainConnector:
             Contract: A Web3 Contract object.
         """
         checksum_address = self.web3.to_checksum_address(address)
-        return self.web3.eth.contract(address=checksum_address, abi=abi)
+        key = (checksum_address, id(abi))
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            factory = self._factory_cache.get(id(abi))
+            if factory is None:
+                factory = self.web3.eth.contract(abi=abi)
+                self._factory_cache[id(abi)] = factory
+            contract = factory(address=checksum_address)
+            self._contract_cache[key] = contract
+        return contract
+
+    async def get_async_web3(self) -> AsyncWeb3:
+        """
+        Returns an AsyncWeb3 instance for the same endpoint, creating it on first use.
+        It must be created inside the running event loop, because both the aiohttp session
+        and a persistent WebSocket connection are bound to that loop.
+
+        Returns:
+            AsyncWeb3: The asynchronous Web3 instance.
+        """
+        if self._async_web3 is None:
+            if self.is_websocket:
+                async_web3 = await AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.rpc_url))
+            else:
+                async_web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_url))
+            async_web3.middleware_onion.add(construct_async_rpc_cache_middleware(self._rpc_cache), 'rpc_cache')
+            self._async_web3 = async_web3
+        return self._async_web3
+
+    def batch_request(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Sends several JSON-RPC calls to the node in a single HTTP request.
+        Calls in one batch are answered by the same node, which keeps their results
+        consistent behind a load balancer. WebSocket connections are already pinned to
+        one node, so there the calls are simply sent one after another.
+
+        Args:
+            calls (List[Tuple[str, List[Any]]]): (method, params) pairs to send.
+
+        Returns:
+            List[Any]: The raw (unformatted) results, in the same order as `calls`.
+        """
+        if self.is_websocket:
+            replies = [
+                dict(self.web3.provider.make_request(method, params), id=request_id)
+                for request_id, (method, params) in enumerate(calls)
+            ]
+            return self._unwrap_batch(replies)
+
+        payload = [
+            {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        response = self._session.post(self.rpc_url, json=payload, timeout=RPC_REQUEST_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        replies = orjson.loads(response.content)
+        if not isinstance(replies, list):
+            # Nodes reply with a single error object if they reject the batch as a whole.
+            raise ValueError(replies.get('error', replies))
+        return self._unwrap_batch(replies)
+
+    @staticmethod
+    def _unwrap_batch(replies: List[Dict[str, Any]]) -> List[Any]:
+        """Orders batch replies by request id and raises on the first RPC error."""
+        results = []
+        for reply in sorted(replies, key=lambda r: r['id']):
+            if 'error' in reply:
+                raise ValueError(reply['error'])
+            results.append(reply['result'])
+        return results
+
+class ProcessedTransactionStore:
+    """
+    Disk-backed record of the source transaction IDs that have already been processed.
+    It survives restarts, so a crash does not lead to releases being sent twice, and entries
+    older than the retention window are purged so the store stays bounded.
+    """
+
+    def __init__(self, db_path: str, retention_days: int):
+        """
+        Opens (or creates) the SQLite database backing the store.
+
+        Args:
+            db_path (str): Path of the SQLite database file.
+            retention_days (int): How long a processed transaction ID is kept.
+        """
+        self.retention_seconds = retention_days * 24 * 60 * 60
+        self._conn = sqlite3.connect(db_path)
+        # WAL with synchronous=NORMAL keeps each insert durable across process crashes
+        # without an fsync per commit.
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS processed (tx_id BLOB PRIMARY KEY, ts INTEGER NOT NULL) WITHOUT ROWID'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS processed_ts ON processed (ts)')
+        self._inserts_since_prune = 0
+        self.prune()
+
+    def __contains__(self, tx_id: bytes) -> bool:
+        row = self._conn.execute('SELECT 1 FROM processed WHERE tx_id = ?', (tx_id,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM processed').fetchone()[0]
+
+    def add(self, tx_id: bytes):
+        """
+        Records a transaction ID as processed.
+
+        Args:
+            tx_id (bytes): The raw 32-byte source transaction ID.
+        """
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO processed (tx_id, ts) VALUES (?, ?)', (tx_id, int(time.time()))
+            )
+        self._inserts_since_prune += 1
+        if self._inserts_since_prune >= PROCESSED_PRUNE_INTERVAL:
+            self.prune()
+
+    def prune(self):
+        """Deletes entries that are older than the retention window."""
+        cutoff = int(time.time()) - self.retention_seconds
+        with self._conn:
+            self._conn.execute('DELETE FROM processed WHERE ts < ?', (cutoff,))
+        self._inserts_since_prune = 0
 
 class BridgeEventHandler:
     """
@@ -115,95 +502,252 @@ class BridgeEventHandler:
         """
         self.config = config
         self.dest_connector = dest_connector
-        self.dest_bridge_contract = self.dest_connector.get_contract(
-            self.config.destination_bridge_address,
-            DESTINATION_BRIDGE_ABI
+        self.processed_transactions = ProcessedTransactionStore(
+            config.processed_db_path,
+            config.processed_retention_days
+        )
+        # IDs being processed right now; guards against the same event twice in one batch.
+        self._in_flight = set()
+        # Bounds how many releases are built, signed and sent at the same time.
+        self._release_slots = asyncio.Semaphore(config.max_concurrent_releases)
+
+        # Deriving the account (public key recovery + keccak) is done once, not per event.
+        self._account = self.dest_connector.web3.eth.account.from_key(config.listener_private_key)
+        self.wallet_address = self._account.address
+
+        # Nonces are handed out from a local counter seeded once from the pending state, so
+        # concurrent releases never reuse a nonce and no per-event RPC is needed.
+        self._nonce = self.dest_connector.web3.eth.get_transaction_count(self.wallet_address, 'pending')
+        self._nonce_lock = threading.Lock()
+        self._nonce_stale = False
+        self._nonces_since_sync = 0
+
+        # (transaction fee fields, time.monotonic() of the fetch)
+        self._fee_cache: Tuple[Dict[str, int], float] = ({}, float('-inf'))
+        self._fee_lock = asyncio.Lock()
+        # Cleared the first time the destination chain turns out not to support EIP-1559.
+        self._use_eip1559 = True
+
+        # Only the releaseTokens arguments, nonce and gas price differ between releases, so the
+        # function selector, argument types and the rest of the transaction are prepared once
+        # and calldata is ABI-encoded directly instead of going through build_transaction.
+        release_abi = next(
+            abi for abi in DESTINATION_BRIDGE_ABI
+            if abi['type'] == 'function' and abi['name'] == 'releaseTokens'
         )
-        self.processed_transactions = set() # In-memory store for processed event IDs
+        self._release_selector = function_abi_to_4byte_selector(release_abi)
+        self._release_arg_types = get_abi_input_types(release_abi)
+        self._tx_template = {
+            'from': self.wallet_address,
+            'to': to_checksum_address(config.destination_bridge_address),
+            'value': 0,
+            'gas': 200000, # A sensible default, can be estimated
+            'chainId': self.dest_connector.chain_id,
+        }
+
+    def _next_nonce(self) -> int:
+        """
+        Reserves the next nonce from the local counter.
+        The counter is advanced before the transaction is built, so a failed attempt never
+        hands the same nonce out twice.
+
+        Returns:
+            int: The reserved nonce.
+        """
+        with self._nonce_lock:
+            nonce = self._nonce
+            self._nonce += 1
+            self._nonces_since_sync += 1
+            return nonce
+
+    async def _sync_nonce_if_needed(self):
+        """
+        Re-reads the pending nonce from the chain after a failure or every
+        NONCE_RESYNC_INTERVAL reservations. Only called between batches, when no
+        reserved nonce is still in flight.
+        """
+        if not self._nonce_stale and self._nonces_since_sync < NONCE_RESYNC_INTERVAL:
+            return
+        w3 = await self.dest_connector.get_async_web3()
+        nonce = await w3.eth.get_transaction_count(self.wallet_address, 'pending')
+        with self._nonce_lock:
+            self._nonce = nonce
+            self._nonce_stale = False
+            self._nonces_since_sync = 0
+        logger.info("Resynchronized local nonce counter from chain: %d", nonce)
+
+    async def _get_fee_fields(self) -> Dict[str, int]:
+        """
+        Returns the fee fields for release transactions, refreshing them at most every
+        FEE_TTL_SECONDS. Concurrent callers wait on a single refresh.
+
+        Returns:
+            Dict[str, int]: Type-2 fee fields, or `gasPrice` on chains without EIP-1559.
+        """
+        async with self._fee_lock:
+            fees, fetched_at = self._fee_cache
+            if time.monotonic() - fetched_at > FEE_TTL_SECONDS:
+                fees = await self._fetch_fee_fields()
+                self._fee_cache = (fees, time.monotonic())
+            return fees
+
+    async def _fetch_fee_fields(self) -> Dict[str, int]:
+        """
+        Derives EIP-1559 fees from a single `eth_feeHistory` call: the priority fee is the
+        median of the recent blocks' FEE_REWARD_PERCENTILE tips, and the fee cap leaves room
+        for the base fee to double. Chains that do not implement `eth_feeHistory` or report no
+        base fee are switched to the legacy gas price for good; other RPC errors only fall back
+        to it until the next refresh.
+
+        Returns:
+            Dict[str, int]: The fee fields to merge into a transaction.
+        """
+        w3 = await self.dest_connector.get_async_web3()
+        if self._use_eip1559:
+            try:
+                history = await w3.eth.fee_history(FEE_HISTORY_BLOCKS, 'latest', [FEE_REWARD_PERCENTILE])
+            except MethodUnavailable:
+                # web3 raises this (not ValueError) for a -32601 "method not found" response.
+                history = {}
+            except ValueError as e:
+                # Rate limits and node hiccups are transient: price this TTL window with the
+                # legacy gas price, and try eth_feeHistory again on the next refresh.
+                logger.warning("eth_feeHistory failed (%r). Using legacy gas price for now.", e)
+                return {'gasPrice': await w3.eth.gas_price}
+            # The last entry is the base fee of the next (pending) block.
+            base_fees = history.get('baseFeePerGas') or []
+            if not any(base_fees):
+                logger.warning("Destination chain does not support EIP-1559 fees. Using legacy gas price.")
+                self._use_eip1559 = False
+            else:
+                base_fee = base_fees[-1]
+                try:
+                    tip = int(statistics.median(reward[0] for reward in history['reward']))
+                except (KeyError, IndexError, statistics.StatisticsError):
+                    try:
+                        tip = await w3.eth.max_priority_fee
+                    except (ValueError, MethodUnavailable) as e:
+                        logger.warning("No priority fee estimate available (%r). Using legacy gas price for now.", e)
+                        return {'gasPrice': await w3.eth.gas_price}
+                return {
+                    'type': 2,
+                    'maxFeePerGas': base_fee * 2 + tip,
+                    'maxPriorityFeePerGas': tip,
+                }
+        return {'gasPrice': await w3.eth.gas_price}
+
+    async def process_events(self, events: List[Dict[str, Any]]):
+        """
+        Processes a batch of events concurrently, with at most `max_concurrent_releases`
+        releases in progress at once. Every event is attempted even if others fail.
+
+        Args:
+            events (List[Dict[str, Any]]): Decoded source chain events.
 
-    def process_event(self, event: Dict[str, Any]):
+        Raises:
+            RuntimeError: If any release failed, so the caller does not mark the range as
+                processed. Releases that succeeded are in the dedup store and are skipped
+                when the range is scanned again.
+        """
+        await self._sync_nonce_if_needed()
+        results = await asyncio.gather(*[self.process_event(event) for event in events], return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            raise RuntimeError(f"{len(failures)} of {len(events)} releases failed") from failures[0]
+
+    async def process_event(self, event: Dict[str, Any]):
         """
         Main logic for processing a single bridge event.
         It checks for duplicates and then simulates the token release on the destination chain.
 
         Args:
             event (Dict[str, Any]): The event data from web3.py.
+
+        Raises:
+            Exception: Re-raised from the release after it has been logged.
         """
-        try:
-            tx_id = event['args']['transactionId'].hex()
-            if tx_id in self.processed_transactions:
-                logger.warning(f"Event with tx_id {tx_id} already processed. Skipping.")
-                return
+        raw_tx_id = bytes(event['args']['transactionId'])
+        tx_id = raw_tx_id.hex()
+        if raw_tx_id in self._in_flight or raw_tx_id in self.processed_transactions:
+            logger.warning("Event with tx_id %s already processed. Skipping.", tx_id)
+            return
 
-            logger.info(f"Processing new event: transactionId={tx_id}")
+        self._in_flight.add(raw_tx_id)
+        try:
+            logger.info("Processing new event: transactionId=%s", tx_id)
             # In a real scenario, we would perform more checks (e.g., confirmation count)
-            self._simulate_release_tokens(event)
+            # The nonce is reserved before waiting for a release slot: batch coroutines start
+            # in event order, so nonces follow the on-chain order of the source events.
+            nonce = self._next_nonce()
+            async with self._release_slots:
+                await self._simulate_release_tokens(event, nonce)
 
-            self.processed_transactions.add(tx_id)
-            logger.info(f"Successfully processed event for tx_id {tx_id}")
+            self.processed_transactions.add(raw_tx_id)
+            logger.info("Successfully processed event for tx_id %s", tx_id)
 
         except Exception as e:
-            logger.error(f"Error processing event {event}: {e}", exc_info=True)
+            # Formatting a traceback for every failed event is costly during node incidents;
+            # it is only rendered when debug logging is enabled.
+            logger.error("Error processing event %s: %r", tx_id, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback for failed event %s", tx_id, exc_info=True)
+            raise
+        finally:
+            self._in_flight.discard(raw_tx_id)
 
-    def _simulate_release_tokens(self, event: Dict[str, Any]):
+    async def _simulate_release_tokens(self, event: Dict[str, Any], nonce: int):
         """
         Simulates the process of building, signing, and sending a transaction
         to the destination bridge contract to release the corresponding tokens.
 
         Args:
             event (Dict[str, Any]): The source chain event.
+            nonce (int): The nonce reserved for the release transaction.
         """
         args = event['args']
         sender_address = args['sender'] # The final recipient of the tokens
         tx_id = args['transactionId']
 
         logger.info(
-            f"Preparing to release {args['amount']} of token {args['token']} "
-            f"to {sender_address} on destination chain for source tx_id {tx_id.hex()}"
+            "Preparing to release %s of token %s to %s on destination chain for source tx_id %s",
+            args['amount'], args['token'], sender_address, tx_id.hex()
         )
 
         # --- This section simulates a real transaction --- #
-        # 1. Get the account from private key
-        account = self.dest_connector.web3.eth.account.from_key(self.config.listener_private_key)
-        wallet_address = account.address
-
-        # 2. Build the transaction
+        # 1. Build the transaction from the template and pre-encoded calldata
         try:
-            nonce = self.dest_connector.web3.eth.get_transaction_count(wallet_address)
-            tx_payload = {
-                'from': wallet_address,
+            fees = await self._get_fee_fields()
+            calldata = self._release_selector + self.dest_connector.web3.codec.encode(
+                self._release_arg_types,
+                [tx_id, sender_address, args['token'], args['amount']]
+            )
+            release_tx = {
+                **self._tx_template,
+                **fees,
                 'nonce': nonce,
-                'gas': 200000, # A sensible default, can be estimated
-                'gasPrice': self.dest_connector.web3.eth.gas_price,
+                'data': calldata,
             }
 
-            release_tx = self.dest_bridge_contract.functions.releaseTokens(
-                tx_id,
-                sender_address,
-                args['token'],
-                args['amount']
-            ).build_transaction(tx_payload)
-
-            # 3. Sign the transaction
-            signed_tx = self.dest_connector.web3.eth.account.sign_transaction(
-                release_tx, private_key=self.config.listener_private_key
-            )
+            # 2. Sign the transaction with the pre-derived account
+            signed_tx = self._account.sign_transaction(release_tx)
             
-            # 4. In this simulation, we will NOT send the transaction.
+            # 3. In this simulation, we will NOT send the transaction.
             # Instead, we will log the details.
-            # In a real system, you would uncomment the following lines:
-            # tx_hash = self.dest_connector.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            # logger.info(f"Submitted release transaction to destination chain. Tx hash: {tx_hash.hex()}")
-            # receipt = self.dest_connector.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-            # if receipt.status == 0:
-            #     raise ContractLogicError("Token release transaction failed on-chain.")
+            # In a real system, you would uncomment the following lines. The send is
+            # fire-and-forget: the node orders this wallet's transactions by nonce, so waiting
+            # for each receipt here would only serialize the batch again.
+            # w3 = await self.dest_connector.get_async_web3()
+            # tx_hash = await w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            # logger.info("Submitted release transaction to destination chain. Tx hash: %s", tx_hash.hex())
 
-            logger.info(f"[SIMULATION] Would have sent transaction to release tokens.")
-            logger.info(f"[SIMULATION] Signed Tx: {signed_tx.hash.hex()}")
+            logger.info("[SIMULATION] Would have sent transaction to release tokens.")
+            logger.info("[SIMULATION] Signed Tx: %s", signed_tx.hash.hex())
 
-        except Exception as e:
-            logger.error(f"Failed to build or sign the release transaction for {tx_id.hex()}: {e}", exc_info=True)
-            # Implement retry logic or a dead-letter queue here for production systems
+        except Exception:
+            # The reserved nonce may now be a gap; re-read it from the chain before the next batch.
+            self._nonce_stale = True
+            # Implement retry logic or a dead-letter queue here for production systems.
+            # The failure is logged once, by process_event.
             raise
 
 class BridgeEventListener:
@@ -226,46 +770,346 @@ class BridgeEventListener:
             config.source_bridge_address, 
             SOURCE_BRIDGE_ABI
         )
-        self.last_processed_block = config.start_block or self.source_connector.web3.eth.block_number
+        # Every event in the source bridge ABI is fetched by one OR-topic query and routed by
+        # topic0. The ABIs and topics are constant, so resolve them once instead of on every tick.
+        self.event_abis = {
+            event_abi_to_log_topic(abi): abi
+            for abi in SOURCE_BRIDGE_ABI
+            if abi['type'] == 'event' and not abi.get('anonymous')
+        }
+        self.event_topics = [Web3.to_hex(topic) for topic in self.event_abis]
+        # Event name -> coroutine taking a batch of decoded events of that type.
+        self.event_routes = {
+            'BridgeTransferInitiated': self.event_handler.process_events,
+        }
+        self.latest_block = self.source_connector.web3.eth.block_number
+        # Every event up to `last_processed_block` has been handled. Logs are fetched up to
+        # `last_scanned_block`, which runs ahead while the last scanned range is dispatched.
+        # A cursor saved by a previous run takes precedence over the configured start block.
+        self._cursor_path = Path(config.cursor_file)
+        saved_block = self._load_cursor()
+        if saved_block is not None:
+            logger.info("Resuming from saved cursor %s: block %d", self._cursor_path, saved_block)
+            self.last_processed_block = saved_block
+        else:
+            self.last_processed_block = config.start_block or self.latest_block
+        self.last_scanned_block = self.last_processed_block
+        self._pending_dispatch: Optional[asyncio.Task] = None
+        # Adaptive eth_getLogs chunk size: halved on range errors, regrown after a success streak.
+        self.block_range = config.max_block_range
+        self._block_range_streak = 0
 
-    def run(self):
+    def _load_cursor(self) -> Optional[int]:
         """
-        Starts the main event listening loop.
+        Reads the last processed block saved by a previous run.
+
+        Returns:
+            Optional[int]: The saved block number, or None if there is no cursor file.
+        """
+        try:
+            return int(self._cursor_path.read_text().strip())
+        except FileNotFoundError:
+            return None
+
+    def _mark_processed(self, block_number: int):
         """
-        logger.info(f"Starting bridge event listener. Watching contract {self.config.source_bridge_address}")
-        logger.info(f"Initial block to scan from: {self.last_processed_block}")
+        Advances `last_processed_block` and persists it. The cursor is written to a temporary
+        file and renamed over the old one, so a crash never leaves a truncated cursor behind.
 
-        while True:
+        Args:
+            block_number (int): The block up to which all events have been handled.
+        """
+        self.last_processed_block = block_number
+        tmp_path = self._cursor_path.with_name(self._cursor_path.name + '.tmp')
+        tmp_path.write_text(str(block_number))
+        os.replace(tmp_path, self._cursor_path)
+
+    def _fetch_head_and_events(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Fetches the latest block number and all new bridge events in one batched round-trip.
+
+        The log query starts at `last_scanned_block` rather than the block after it, so the
+        range is never empty (some nodes reject fromBlock > latest); logs from blocks that were
+        already scanned are dropped here, as are logs past the reported head.
+
+        Returns:
+            Tuple[int, List[Dict[str, Any]]]: The latest block number and the decoded events.
+        """
+        block_number, raw_logs = self.source_connector.batch_request([
+            ('eth_blockNumber', []),
+            ('eth_getLogs', [{
+                'fromBlock': hex(self.last_scanned_block),
+                'toBlock': 'latest',
+                'address': self.source_bridge_contract.address,
+                'topics': [self.event_topics],
+            }]),
+        ])
+        latest_block = int(block_number, 16)
+
+        events = []
+        for raw_log in raw_logs:
+            log = log_entry_formatter(raw_log)
+            if self.last_scanned_block < log['blockNumber'] <= latest_block:
+                events.append(self._decode_log(log))
+        return latest_block, events
+
+    def _decode_log(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decodes a formatted log entry with the ABI of the event its topic0 identifies.
+
+        Args:
+            log (Dict[str, Any]): A log entry as returned by web3.py's log formatter.
+
+        Returns:
+            Dict[str, Any]: The decoded event data.
+        """
+        event_abi = self.event_abis[bytes(log['topics'][0])]
+        return get_event_data(self.source_connector.web3.codec, event_abi, log)
+
+    async def _dispatch_events(self, events: List[Dict[str, Any]]):
+        """
+        Routes decoded events to the handler registered for their event type, keeping the
+        original on-chain order within each type.
+
+        Args:
+            events (List[Dict[str, Any]]): Decoded source chain events.
+        """
+        events_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        for event in events:
+            events_by_name.setdefault(event['event'], []).append(event)
+
+        for event_name, batch in events_by_name.items():
+            route = self.event_routes.get(event_name)
+            if route is None:
+                logger.info("Ignoring %d '%s' events with no registered handler.", len(batch), event_name)
+                continue
+            await route(batch)
+
+    def _get_events(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        """
+        Fetches and decodes all bridge events in an inclusive block range with one eth_getLogs call.
+
+        Args:
+            from_block (int): First block of the range.
+            to_block (int): Last block of the range.
+
+        Returns:
+            List[Dict[str, Any]]: The decoded events, in on-chain order.
+        """
+        logs = self.source_connector.web3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': self.source_bridge_contract.address,
+            'topics': [self.event_topics],
+        })
+        return [self._decode_log(log) for log in logs]
+
+    def _get_block_events_from_receipts(self, block_number: int) -> List[Dict[str, Any]]:
+        """
+        Fetches the bridge events of one block from its receipts (`eth_getBlockReceipts`),
+        filtering the logs by address and topic locally. Used when the node refuses
+        eth_getLogs even for a single block, e.g. because the block is too dense or log
+        queries are rate-limited.
+
+        Args:
+            block_number (int): The block to read.
+
+        Returns:
+            List[Dict[str, Any]]: The decoded events, in on-chain order.
+
+        Raises:
+            ValueError: If the node does not have the block (a null result), e.g. a lagging
+                node behind a load balancer; the block is retried on the next iteration.
+        """
+        receipts, = self.source_connector.batch_request([('eth_getBlockReceipts', [hex(block_number)])])
+        if receipts is None:
+            raise ValueError(f"Node returned no receipts for block {block_number}")
+        bridge_address = self.source_bridge_contract.address.lower()
+
+        events = []
+        for receipt in receipts:
+            for raw_log in receipt['logs']:
+                if raw_log['address'].lower() != bridge_address or not raw_log['topics']:
+                    continue
+                log = log_entry_formatter(raw_log)
+                if bytes(log['topics'][0]) in self.event_abis:
+                    events.append(self._decode_log(log))
+        return events
+
+    async def _finish_pending_dispatch(self):
+        """
+        Waits for the events of the previously scanned range to be handled. If that failed,
+        the scan is rewound to `last_processed_block` so the range is fetched again, and the
+        error is re-raised.
+        """
+        task, self._pending_dispatch = self._pending_dispatch, None
+        if task is None:
+            return
+        try:
+            await task
+        except Exception:
+            self.last_scanned_block = self.last_processed_block
+            raise
+
+    async def _dispatch_range(self, to_block: int, events: List[Dict[str, Any]]):
+        """
+        Dispatches the events of a scanned range and marks the range as processed. If a
+        handler raises, the range is left unmarked so it is scanned again.
+
+        Args:
+            to_block (int): Last block of the scanned range.
+            events (List[Dict[str, Any]]): The decoded events found in the range.
+        """
+        if events:
+            logger.info("Found %d new events.", len(events))
+            await self._dispatch_events(events)
+        else:
+            logger.info("No new events found in this range.")
+
+        self._mark_processed(to_block)
+
+    async def _process_range(self, from_block: int, to_block: int, events: List[Dict[str, Any]]):
+        """
+        Hands the events of a scanned range to a background task and returns immediately, so
+        the releases are sent while the next range is being fetched. At most one range is in
+        flight: the previous one is awaited first, which keeps ranges completing in order.
+
+        Args:
+            from_block (int): First block of the scanned range.
+            to_block (int): Last block of the scanned range.
+            events (List[Dict[str, Any]]): The decoded events found in the range.
+        """
+        await self._finish_pending_dispatch()
+        logger.info("Scanned for bridge events from block %d to %d", from_block, to_block)
+        self.last_scanned_block = to_block
+        self._pending_dispatch = asyncio.create_task(self._dispatch_range(to_block, events))
+
+    async def _scan_in_chunks(self, to_block: int):
+        """
+        Scans from `last_scanned_block` up to `to_block` in chunks of at most `block_range`
+        blocks, so a long outage does not turn into one eth_getLogs call that times out or is
+        rejected. The chunk size is halved whenever the node rejects a range and doubled again
+        (up to `max_block_range`) after a streak of successful chunks; a single block that is
+        still rejected is read from its receipts instead. The processed block is advanced
+        after every chunk, which bounds the re-work after a failure.
+
+        Args:
+            to_block (int): Last block to scan.
+        """
+        while self.last_scanned_block < to_block:
+            start = self.last_scanned_block + 1
+            end = min(start + self.block_range - 1, to_block)
             try:
-                latest_block = self.source_connector.web3.eth.block_number
+                events = await asyncio.to_thread(self._get_events, start, end)
+            except (ValueError, requests.exceptions.Timeout) as e:
+                if not is_block_range_error(e):
+                    raise
+                if self.block_range > 1:
+                    self.block_range = max(1, self.block_range // 2)
+                    self._block_range_streak = 0
+                    logger.warning("Node rejected blocks %d-%d (%s). Retrying with %d blocks per query.", start, end, e, self.block_range)
+                    continue
+                logger.warning("Node rejected eth_getLogs for block %d (%s). Reading its block receipts instead.", start, e)
+                events = await asyncio.to_thread(self._get_block_events_from_receipts, start)
 
-                if latest_block > self.last_processed_block:
-                    from_block = self.last_processed_block + 1
-                    to_block = latest_block
-                    logger.info(f"Scanning for 'BridgeTransferInitiated' events from block {from_block} to {to_block}")
+            await self._process_range(start, end, events)
 
-                    # Create an event filter
-                    event_filter = self.source_bridge_contract.events.BridgeTransferInitiated.create_filter(
-                        fromBlock=from_block,
-                        toBlock=to_block
-                    )
-                    events = event_filter.get_all_entries()
+            if self.block_range < self.config.max_block_range:
+                self._block_range_streak += 1
+                if self._block_range_streak >= BLOCK_RANGE_GROWTH_STREAK:
+                    self.block_range = min(self.block_range * 2, self.config.max_block_range)
+                    self._block_range_streak = 0
 
-                    if events:
-                        logger.info(f"Found {len(events)} new events.")
-                        for event in events:
-                            self.event_handler.process_event(event)
-                    else:
-                        logger.info("No new events found in this range.")
+    async def _poll_once(self):
+        """
+        Scans all blocks produced since `last_scanned_block` and dispatches their events.
+        Near the head, the block number and the logs are fetched in one batched request;
+        when the listener has fallen further behind, the range is scanned in chunks.
+        The blocking source chain RPCs run in a worker thread to keep the event loop free.
+        """
+        if self.latest_block - self.last_scanned_block < self.block_range:
+            try:
+                latest_block, events = await asyncio.to_thread(self._fetch_head_and_events)
+            except (ValueError, requests.exceptions.Timeout) as e:
+                if not is_block_range_error(e):
+                    raise
+                logger.warning("Batched log query was rejected (%s). Falling back to chunked scanning.", e)
+            else:
+                self.latest_block = latest_block
+                if latest_block > self.last_scanned_block:
+                    await self._process_range(self.last_scanned_block + 1, latest_block, events)
+                return
 
-                    self.last_processed_block = to_block
+        self.latest_block = await asyncio.to_thread(lambda: self.source_connector.web3.eth.block_number)
+        await self._scan_in_chunks(self.latest_block)
 
+    async def run(self):
+        """
+        Starts the main event listening loop.
+        WebSocket endpoints are served by a log subscription; HTTP endpoints are polled.
+        """
+        logger.info("Starting bridge event listener. Watching contract %s", self.config.source_bridge_address)
+        logger.info("Initial block to scan from: %d", self.last_processed_block)
+
+        if self.source_connector.is_websocket:
+            await self._run_subscription()
+        else:
+            await self._run_polling()
+
+    async def _run_polling(self):
+        """
+        Polls the source chain every `poll_interval_seconds`. The wait does not block the
+        event loop, so releases dispatched by the previous tick keep being sent meanwhile.
+        """
+        while True:
+            try:
+                await self._poll_once()
             except requests.exceptions.ConnectionError as e:
-                logger.error(f"RPC connection error: {e}. Retrying in {self.config.poll_interval_seconds}s...")
+                logger.error("RPC connection error: %s. Retrying in %ss...", e, self.config.poll_interval_seconds)
             except Exception as e:
-                logger.error(f"An unexpected error occurred in the main loop: {e}", exc_info=True)
-            
-            time.sleep(self.config.poll_interval_seconds)
+                logger.error("An unexpected error occurred in the main loop: %r", e)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Traceback for main loop error", exc_info=True)
+
+            await asyncio.sleep(self.config.poll_interval_seconds)
+
+    async def _run_subscription(self):
+        """
+        Listens for bridge events through an `eth_subscribe("logs")` subscription.
+        Events are pushed by the node as soon as their block is imported, so there is no
+        polling delay and no RPC traffic while the chain is idle. After every (re)connect,
+        blocks missed while disconnected are scanned once before streaming resumes.
+        """
+        while True:
+            try:
+                provider = WebsocketProviderV2(self.config.source_chain_rpc)
+                async with AsyncWeb3.persistent_websocket(provider) as w3:
+                    await w3.eth.subscribe('logs', {
+                        'address': self.source_bridge_contract.address,
+                        'topics': [self.event_topics],
+                    })
+                    # Subscribe first, then catch up, so no block falls between the two.
+                    await self._poll_once()
+                    await self._finish_pending_dispatch()
+                    logger.info("Subscribed to bridge event logs.")
+
+                    async for message in w3.ws.listen_to_websocket():
+                        log = message['result']
+                        if log.get('removed'):
+                            # Log was dropped by a chain reorganization.
+                            continue
+                        await self._dispatch_events([self._decode_log(log)])
+                        # Later logs of the same block may still arrive, so only the blocks
+                        # before it are known to be complete.
+                        completed_block = max(self.last_processed_block, log['blockNumber'] - 1)
+                        if completed_block > self.last_processed_block:
+                            self._mark_processed(completed_block)
+                        self.last_scanned_block = max(self.last_scanned_block, completed_block)
+            except Exception as e:
+                logger.error("Log subscription failed: %r. Reconnecting in %ss...", e, self.config.poll_interval_seconds)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Traceback for log subscription failure", exc_info=True)
+            await asyncio.sleep(self.config.poll_interval_seconds)
 
 def load_config_from_env() -> BridgeConfig:
     """
@@ -291,7 +1135,12 @@ def load_config_from_env() -> BridgeConfig:
         destination_bridge_address=os.getenv('DESTINATION_BRIDGE_ADDRESS'),
         listener_private_key=os.getenv('LISTENER_PRIVATE_KEY'),
         start_block=int(os.getenv('START_BLOCK', 0)),
-        poll_interval_seconds=int(os.getenv('POLL_INTERVAL_SECONDS', 15))
+        poll_interval_seconds=int(os.getenv('POLL_INTERVAL_SECONDS', 15)),
+        max_block_range=int(os.getenv('MAX_BLOCK_RANGE', 2048)),
+        processed_db_path=os.getenv('PROCESSED_DB_PATH', 'processed_transactions.db'),
+        processed_retention_days=int(os.getenv('PROCESSED_RETENTION_DAYS', 30)),
+        cursor_file=os.getenv('CURSOR_FILE', '.bridge_cursor'),
+        max_concurrent_releases=int(os.getenv('MAX_CONCURRENT_RELEASES', 16))
     )
 
 if __name__ == "__main__":
@@ -304,8 +1153,8 @@ if __name__ == "__main__":
         
         # Initialize and run the listener
         listener = BridgeEventListener(config)
-        listener.run()
+        asyncio.run(listener.run())
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
     except Exception as e:
-        logger.critical(f"A critical error occurred during initialization: {e}", exc_info=True)
+        logger.critical("A critical error occurred during initialization: %s", e, exc_info=True)